@@ -164,7 +164,8 @@ if sys.version > '3.5.2':  # pragma: no cover
         def start():  # pragma: no cover
             from spruned.application.logging_factory import Logger
             from spruned.application.database import sqlite
-            from spruned.builder import repository
+            from spruned.builder import get_instance
+            repository = get_instance().repository
 
             migrations.run(sqlite)
 
@@ -352,8 +352,8 @@ class JSONRPCServer:
         loop.stop()
         from spruned.application.context import ctx
         if ctx.is_zmq_enabled():
-            from spruned.builder import zmq_observer
-            zmq_observer.close_zeromq()
+            from spruned.builder import get_instance
+            get_instance().zmq_observer.close_zeromq()
         return None
 
     async def getmempoolinfo(self):
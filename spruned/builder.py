@@ -1,6 +1,16 @@
+from collections import namedtuple
+
 from spruned.application.context import ctx as _ctx, Context
 from spruned.daemon.zeromq import build_zmq
 
+Instance = namedtuple(
+    'Instance', [
+        'jsonrpc_server', 'headers_reactor', 'blocks_reactor', 'repository',
+        'cache', 'zmq_context', 'zmq_observer', 'p2p_interface'
+    ]
+)
+_instance = None
+
 
 def builder(ctx: Context):  # pragma: no cover
     from spruned.application.cache import CacheAgent
@@ -48,9 +58,14 @@ def builder(ctx: Context):  # pragma: no cover
         )
     blocks_reactor = BlocksReactor(repository, p2p_interface, keep_blocks=int(ctx.keep_blocks))
     headers_reactor.add_on_best_height_hit_persistent_callbacks(p2p_connectionpool.set_best_header)
-    return jsonrpc_server, headers_reactor, blocks_reactor, repository, \
-           cache, zmq_context, zmq_observer, p2p_interface
+    return Instance(
+        jsonrpc_server, headers_reactor, blocks_reactor, repository,
+        cache, zmq_context, zmq_observer, p2p_interface
+    )
 
 
-jsonrpc_server, headers_reactor, blocks_reactor, repository, \
-cache, zmq_context, zmq_observer, p2p_interface = builder(_ctx)
+def get_instance(ctx: Context = _ctx) -> Instance:  # pragma: no cover
+    global _instance
+    if _instance is None:
+        _instance = builder(ctx)
+    return _instance
@@ -55,76 +55,32 @@ class BaseConnectionPool(ConnectionPoolAbstract, metaclass=abc.ABCMeta):
         return [connection for connection in self.connections if connection.connected]
 
     def _pick_peer(self):
-        i = 0
-        while 1:
-            if self.peers:
-                server = random.choice(self.peers)
-                if server not in [connection.hostname for connection in self.connections]:
-                    if ':' in server[0] and not self._ipv6:
-                        i += 1
-                        continue
-                    return server
-                i += 1
-                if i < 100:
-                    continue
+        peers = self._pick_multiple_peers(1)
+        if not peers:
             raise exceptions.NoServersException
+        return peers[0]
 
     def _pick_multiple_peers(self, howmany: int):
         assert howmany >= 1
-        i = 0
-        servers = []
-        while 1:
-            i += 1
-            if self.peers:
-                if i > 100:
-                    return servers
-                server = self._pick_peer()
-                if server in servers:
-                    continue
-                servers.append(server)
-                if len(servers) == howmany:
-                    return servers
-            else:
-                raise exceptions.NoServersException
+        used = {connection.hostname for connection in self.connections}
+        candidates = [
+            peer for peer in self.peers if peer[0] not in used and (self._ipv6 or ':' not in peer[0])
+        ]
+        return random.sample(candidates, min(howmany, len(candidates)))
 
     def _pick_connection(self, fail_silent=False):
-        i = 0
-        while 1:
-            if self.established_connections:
-                connection = random.choice(self.established_connections)
-                if connection.connected and connection.score > 0:
-                    return connection
-                if ':' in connection.hostname and not self._ipv6:
-                    i += 1
-                    continue
-                i += 1
-                if i < 100:
-                    continue
-            if not fail_silent:
-                raise exceptions.NoPeersException
-            return
+        connections = [connection for connection in self.established_connections if connection.score > 0]
+        if connections:
+            return random.choice(connections)
+        if not fail_silent:
+            raise exceptions.NoPeersException
 
     def _pick_multiple_connections(self, howmany: int, accept=2) -> List[ConnectionAbstract]:
         assert howmany >= 1
-        i = 0
-        connections = []
-        while 1:
-            if self.established_connections:
-                connection = self._pick_connection()
-                if connection in connections:
-                    i += 1
-                    if i > 100:
-                        if len(connections) >= accept:
-                            return connection
-                        raise exceptions.NoPeersException
-                    continue
-                connections.append(connection)
-                if len(connections) == howmany:
-                    return connections
-            i += 1
-            if i < 100:
-                continue
+        connections = [connection for connection in self.established_connections if connection.score > 0]
+        if len(connections) < min(howmany, accept):
             raise exceptions.NoPeersException
+        return random.sample(connections, min(howmany, len(connections)))
 
     def _pick_privileged_connections(self, howmany, accept=1) -> List[ConnectionAbstract]:
         connection = sorted([x for x in self.established_connections], key=lambda x: getattr(x, 'score'))
@@ -146,7 +102,7 @@ class BaseConnectionPool(ConnectionPoolAbstract, metaclass=abc.ABCMeta):
 
     async def on_peer_received_header(self, peer: ConnectionAbstract, *_):
         for observer in self._headers_observers:
-            self.loop.create_task(self.delayer(observer(peer, peer.last_header)))
+            self.loop.create_task(observer(peer, peer.last_header))
 
     async def on_peer_received_peers(self, peer: ConnectionAbstract, *_):
         raise NotImplementedError
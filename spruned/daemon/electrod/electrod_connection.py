@@ -1,13 +1,15 @@
 import asyncio
+import json
 import os
 import binascii
 import time
+from collections import Counter
 from typing import Dict
-import async_timeout
 
 from spruned.dependencies.connectrum import ElectrumErrorResponse
 from spruned.dependencies.connectrum import StratumClient
 from spruned.dependencies.connectrum import ServerInfo
+from spruned.dependencies.connectrum import create_unverified_ssl_context
 
 from spruned.application.context import ctx
 from spruned.application.logging_factory import Logger
@@ -23,7 +25,8 @@ class ElectrodConnection(BaseConnection):
             self, hostname: str, protocol: str, keepalive=180,
             client=StratumClient, serverinfo=ServerInfo, nickname=None, proxy=False, loop=None,
             start_score=10, timeout=30, expire_errors_after=180,
-            is_online_checker: callable=None, delayer=async_delayed_task, network=ctx.get_network()
+            is_online_checker: callable=None, delayer=async_delayed_task, network=ctx.get_network(),
+            ssl_context=None
     ):
 
         self.protocol = protocol
@@ -34,6 +37,7 @@ class ElectrodConnection(BaseConnection):
         self.client.keepalive_interval = keepalive
         self.nickname = nickname or binascii.hexlify(os.urandom(8)).decode()
         self.network = network
+        self.ssl_context = ssl_context
         super().__init__(
             hostname=hostname, proxy=proxy, loop=loop, start_score=start_score,
             is_online_checker=is_online_checker, timeout=timeout, delayer=delayer,
@@ -55,52 +59,55 @@ class ElectrodConnection(BaseConnection):
 
     async def connect(self, ignore_version=False, disable_callbacks=False, short_term=False):
         try:
-            with async_timeout.timeout(self._timeout):
-                await self.client.connect(
-                    self.serverinfo_factory(self.nickname, hostname=self.hostname, ports=self.protocol, version="1.4"),
-                    disconnect_callback=not disable_callbacks and self.on_connectrum_disconnect,
-                    disable_cert_verify=True,
-                    proxy=self.proxy,
-                    ignore_version=ignore_version,
-                    short_term=short_term
-                )
-                self._version = self.client.server_version
-                Logger.electrum.info(
-                    'Connected to peer %s:%s (%s)', self.hostname, self.port, self.version and self.version[0]
-                )
-                Logger.electrum.debug('Peer raw response: %s', self.version)
-                if not ignore_version:
-                    res = await self.rpc_call(
-                        'blockchain.transaction.get', [self.network['tx1'], 1]
-                    )
-                    if not isinstance(res, dict) or not res['blockhash'] == self.network['checkpoints'][1]:
-                        raise ValueError
-                self.connected_at = int(time.time())
-                if not disable_callbacks:
-                    await self.on_connect()
+            await asyncio.wait_for(
+                self._connect(ignore_version, disable_callbacks, short_term), self._timeout
+            )
         except Exception as e:
             Logger.electrum.debug('Exception connecting to %s (%s)', self.hostname, e)
             if not disable_callbacks:
                 await self.on_error('connect')
 
+    async def _connect(self, ignore_version, disable_callbacks, short_term):
+        await self.client.connect(
+            self.serverinfo_factory(self.nickname, hostname=self.hostname, ports=self.protocol, version="1.4"),
+            disconnect_callback=not disable_callbacks and self.on_connectrum_disconnect,
+            disable_cert_verify=True,
+            ssl_context=self.ssl_context,
+            proxy=self.proxy,
+            ignore_version=ignore_version,
+            short_term=short_term
+        )
+        self._version = self.client.server_version
+        Logger.electrum.info(
+            'Connected to peer %s:%s (%s)', self.hostname, self.port, self.version and self.version[0]
+        )
+        Logger.electrum.debug('Peer raw response: %s', self.version)
+        if not ignore_version:
+            res = await self.rpc_call(
+                'blockchain.transaction.get', [self.network['tx1'], 1]
+            )
+            if not isinstance(res, dict) or not res['blockhash'] == self.network['checkpoints'][1]:
+                raise ValueError
+        self.connected_at = int(time.time())
+        if not disable_callbacks:
+            await self.on_connect()
+
     def on_connectrum_disconnect(self, *_, **__):
         for callback in self._on_disconnect_callbacks:
             self.loop.create_task(callback(self))
 
     async def ping(self, timeout=2) -> (None, float):
         try:
-            async with async_timeout.timeout(timeout):
-                now = time.time()
-                await self.client.RPC('server.ping')
-                return time.time() - now
+            now = time.time()
+            await asyncio.wait_for(self.client.RPC('server.ping'), timeout)
+            return time.time() - now
         except asyncio.TimeoutError:
             return
 
     async def rpc_call(self, method: str, args):
         try:
-            async with async_timeout.timeout(self._timeout):
-                return await self.client.RPC(method, *args)
-        except asyncio.InvalidStateError:
+            return await asyncio.wait_for(self.client.RPC(method, *args), self._timeout)
+        except (asyncio.CancelledError, asyncio.InvalidStateError):
             raise
         except ElectrumErrorResponse as e:
             if e.args and isinstance(e.args[0], dict):
@@ -113,10 +120,9 @@ class ElectrodConnection(BaseConnection):
 
     async def subscribe(self, channel: str, on_subscription: callable, on_traffic: callable):
         try:
-            async with async_timeout.timeout(self._timeout):
-                future, q = self.client.subscribe(channel)
+            future, q = self.client.subscribe(channel)
             self.subscriptions.append({channel: q})
-            header = await future
+            header = await asyncio.wait_for(future, self._timeout)
             self.starting_height = header['height']
             self._last_header = header
             on_subscription and self.loop.create_task(on_subscription(self))
@@ -126,15 +132,16 @@ class ElectrodConnection(BaseConnection):
             self.loop.create_task(self.delayer(self.on_error(e)))
 
     async def _poll_queue(self, queue: asyncio.Queue, callback):
-        try:
-            header = await queue.get()
-            Logger.electrum.debug('new data from queue: %s', header)
-            self._last_header = header[0]
-            self.loop.create_task(self.delayer(callback(self)))
-            self.loop.create_task(self.delayer(self._poll_queue(queue, callback)))
-        except Exception as e:
-            Logger.electrum.error('queue poll failed')
-            self.loop.create_task(self.delayer(self.on_error(e)))
+        while self.connected:
+            try:
+                header = await queue.get()
+                Logger.electrum.debug('new data from queue: %s', header)
+                self._last_header = header[0]
+                self.loop.create_task(callback(self))
+            except Exception as e:
+                Logger.electrum.error('queue poll failed')
+                self.loop.create_task(self.delayer(self.on_error(e)))
+                return
 
     async def disconnect(self):
         try:
@@ -170,6 +177,8 @@ class ElectrodConnectionPool(BaseConnectionPool):
         self.rpc_call_timeout = rpc_call_timeout
         self.servers_storage = servers_storage
         self._storage_lock = asyncio.Lock()
+        self._need_peers = asyncio.Event()
+        self._ssl_context = create_unverified_ssl_context()
         self.tor = tor
 
     @property
@@ -201,7 +210,21 @@ class ElectrodConnectionPool(BaseConnectionPool):
                 for observer in self._on_connect_observers:
                     self.loop.create_task(observer())
                 self._connection_notified = True
-            await asyncio.sleep(missings and 2 or 10)
+            if missings:
+                await asyncio.sleep(2)
+            else:
+                await self._wait_for_missing_peers(10)
+
+    async def _wait_for_missing_peers(self, timeout: int):
+        try:
+            await asyncio.wait_for(self._need_peers.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self._need_peers.clear()
+
+    def stop(self):
+        super().stop()
+        self._need_peers.set()
 
     async def _connect_servers(self, howmany: int):
         peers = self._pick_multiple_peers(howmany)
@@ -214,12 +237,14 @@ class ElectrodConnectionPool(BaseConnectionPool):
                 proxy=self.proxy,
                 loop=self.loop,
                 is_online_checker=self.is_online,
-                timeout=self.rpc_call_timeout
+                timeout=self.rpc_call_timeout,
+                ssl_context=self._ssl_context
             )
             instance.add_on_connect_callback(self.on_peer_connected)
             instance.add_on_header_callbacks(self.on_peer_received_header)
             instance.add_on_peers_callback(self.on_peer_received_peers)
             instance.add_on_error_callback(self.on_peer_error)
+            instance.add_on_disconnect_callback(self._on_peer_dropped)
             self._connections.append(instance)
             Logger.electrum.debug('Created client instance: %s', peer[0])
             self.loop.create_task(instance.connect())
@@ -232,23 +257,19 @@ class ElectrodConnectionPool(BaseConnectionPool):
         if agreement > len(self.established_connections):
             raise exceptions.NoPeersException
         if agreement > 1:
-            connections = self._pick_multiple_connections(agreement)
-            responses = await asyncio.gather(
-                *[connection.rpc_call(method, params) for connection in connections]
-            )
-            responses = [r for r in responses if r is not None]
-            if len(responses) < agreement:
-                Logger.electrum.exception('call, requested %s responses, received %s', agreement, len(responses))
-                Logger.electrum.debug('call, requested %s responses, received %s', agreement, responses)
-                if fail_silent:
-                    return
-                raise exceptions.ElectrodMissingResponseException
+            connections = self._pick_multiple_connections(self._required_connections, accept=agreement)
+            tasks = {
+                asyncio.ensure_future(connection.rpc_call(method, params)): connection for connection in connections
+            }
             try:
-                return self._handle_responses(responses)
-            except exceptions.NoQuorumOnResponsesException:
+                return await self._get_agreed_response(tasks, agreement)
+            except (exceptions.ElectrodMissingResponseException, exceptions.NoQuorumOnResponsesException):
                 if fail_silent:
                     return
                 raise
+            finally:
+                for task in tasks:
+                    task.cancel()
         connection = self._pick_connection()
         response = await connection.rpc_call(method, params)
         if not response and not fail_silent:
@@ -257,17 +278,47 @@ class ElectrodConnectionPool(BaseConnectionPool):
         return (connection, response) if get_peer else response
 
     @staticmethod
-    def _handle_responses(responses) -> Dict:
-        if len(responses) == 1:
-            return responses and responses[0]
-        for response in responses:
-            if responses.count(response) == len(responses):
-                return response
+    def _response_key(response) -> str:
+        return json.dumps(response, sort_keys=True, separators=(',', ':'))
+
+    async def _get_agreed_response(self, tasks: Dict, agreement: int) -> Dict:
+        responses = []
+        agreed = Counter()
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    response = task.result()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    Logger.electrum.debug('call, peer %s failed: %r', tasks[task].hostname, e)
+                    continue
+                if response is None:
+                    continue
+                responses.append(response)
+                key = self._response_key(response)
+                agreed[key] += 1
+                if agreed[key] >= agreement:
+                    return response
+        if len(responses) < agreement:
+            Logger.electrum.error('call, requested %s responses, received %s', agreement, len(responses))
+            Logger.electrum.debug('call, requested %s responses, received %s', agreement, responses)
+            raise exceptions.ElectrodMissingResponseException
         raise exceptions.NoQuorumOnResponsesException(responses)
 
     def on_peer_received_peers(self, peer: ElectrodConnection, *_):
         raise NotImplementedError
 
+    async def _on_peer_dropped(self, peer: ElectrodConnection, *_):
+        self.on_peer_disconnected(peer)
+        self._need_peers.set()
+
+    async def on_peer_error(self, peer: ElectrodConnection, error_type=None):
+        await super().on_peer_error(peer, error_type=error_type)
+        self._need_peers.set()
+
     async def on_peer_connected(self, peer: ElectrodConnection):
         future = peer.subscribe(
             'blockchain.headers.subscribe',
@@ -112,6 +112,19 @@ class ElectrumErrorResponse(RuntimeError):
     pass
 
 
+def create_unverified_ssl_context():
+    """
+    Create a more liberal SSL context that won't object to self-signed
+    certificates. This is very bad on public Internet, but probably ok
+    over Tor. Build it once and share it between clients: creating a
+    default context loads the system CA store every time.
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
 class StratumProtocol(asyncio.Protocol):
     client = None
     closed = False
@@ -202,7 +215,7 @@ class StratumClient:
             self.ka_task = None
 
     async def connect(self, server_info, proto_code=None, *,
-                      disable_cert_verify=False,
+                      disable_cert_verify=False, ssl_context=None,
                       proxy=None, short_term=False, disconnect_callback=None,
                       ignore_version=True):
         """
@@ -218,14 +231,10 @@ class StratumClient:
         logger.debug("Connecting to: %r" % server_info)
         hostname, port, use_ssl = server_info.get_port(proto_code)
 
-        if use_ssl and disable_cert_verify:
-            # Create a more liberal SSL context that won't
-            # object to self-signed certicates. This is
-            # very bad on public Internet, but probably ok
-            # over Tor
-            use_ssl = ssl.create_default_context()
-            use_ssl.check_hostname = False
-            use_ssl.verify_mode = ssl.CERT_NONE
+        if use_ssl and ssl_context:
+            use_ssl = ssl_context
+        elif use_ssl and disable_cert_verify:
+            use_ssl = create_unverified_ssl_context()
 
         if proxy:
             if have_aiosocks:
@@ -4,11 +4,13 @@ import gc
 import async_timeout
 
 from spruned.application.tools import async_delayed_task
-from spruned.builder import cache, headers_reactor, blocks_reactor, jsonrpc_server, repository, p2p_interface
+from spruned.builder import get_instance
 
 
 async def main_task(loop):  # pragma: no cover
     from spruned.application.logging_factory import Logger
+    jsonrpc_server, headers_reactor, blocks_reactor, repository, \
+        cache, zmq_context, zmq_observer, p2p_interface = get_instance()
     loop.create_task(jsonrpc_server.start())
     try:
         Logger.leveldb.debug('Ensuring integrity of the storage, and tracking missing items')
@@ -38,7 +40,7 @@ async def loop_check_integrity(l):  # pragma: no cover
     this task also prune blocks
     """
     async with async_timeout.timeout(30):
-        await repository.ensure_integrity()
+        await get_instance().repository.ensure_integrity()
 
 
 async def loop_collect_garbage(l):  # pragma: no cover
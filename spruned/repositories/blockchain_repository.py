@@ -1,4 +1,5 @@
 import binascii
+from collections import OrderedDict
 from typing import Dict, List
 
 from pycoin.block import Block
@@ -16,18 +17,23 @@ DB_VERSION = b'\x04'
 class BlockchainRepository(BlockchainRepositoryAbstract):
     current_version = 3
 
-    def __init__(self, session, storage_name, dbpath):
+    def __init__(self, session, storage_name, dbpath, transactions_lru_size=1024):
         self.storage_name = storage_name
+        self._storage_prefix = storage_name + b'.'
         self.session = session
         self.dbpath = dbpath
         self._cache = None
         self.volatile = {}
+        self._transactions_lru = OrderedDict()
+        self._transactions_lru_size = transactions_lru_size
 
     def erase(self):
         from spruned.application.database import init_ldb_storage, erase_ldb_storage
         from spruned.application.tools import inject_attribute
-        from spruned.builder import cache
+        from spruned.builder import get_instance
+        cache = get_instance().cache
         self.session.close()
+        self._transactions_lru.clear()
         erase_ldb_storage()
         inject_attribute(
             init_ldb_storage(), 'session', self, cache
@@ -35,20 +41,23 @@ class BlockchainRepository(BlockchainRepositoryAbstract):
         self.save_db_version()
 
     def save_db_version(self):
-        self.session.put(self.storage_name + b'.' + DB_VERSION, self.current_version.to_bytes(8, 'little'))
+        self.session.put(self._storage_key(DB_VERSION), self.current_version.to_bytes(8, 'little'))
 
     def get_db_version(self):
-        v = self.session.get(self.storage_name + b'.' + DB_VERSION)
+        v = self.session.get(self._storage_key(DB_VERSION))
         return v and int.from_bytes(v, 'little')
 
     def set_cache(self, cache):
         self._cache = cache
 
+    def _storage_key(self, key: bytes) -> bytes:
+        return self._storage_prefix + key
+
     def get_key(self, name: (bytes, str), prefix=b''):
         if isinstance(prefix, str):
             prefix = prefix.encode()
         if isinstance(name, str):
-            name = binascii.unhexlify(name.encode())
+            name = bytes.fromhex(name)
         return (prefix and (prefix + b'.') or b'') + name
 
     async def async_save_block(self, block: Dict, tracker=None, callback=None):
@@ -80,11 +89,11 @@ class BlockchainRepository(BlockchainRepositoryAbstract):
     def _save_block_index(self, blockhash: bytes, blocksize: int, txids: List[bytes]):
         key = self.get_key(blockhash, prefix=BLOCK_INDEX_PREFIX)
         size = blocksize.to_bytes(4, 'little')
-        self.session.put(self.storage_name + b'.' + key, size + b''.join(txids))
+        self.session.put(self._storage_key(key), size + b''.join(txids))
 
     def get_block_index(self, blockhash: str):
         key = self.get_key(blockhash, prefix=BLOCK_INDEX_PREFIX)
-        return self.session.get(self.storage_name + b'.' + key)
+        return self.session.get(self._storage_key(key))
 
     @ldb_batch
     def save_blocks(self, *blocks: Dict) -> List[Dict]:
@@ -96,8 +105,9 @@ class BlockchainRepository(BlockchainRepositoryAbstract):
     @ldb_batch
     def save_transaction(self, transaction: Dict) -> Dict:
         data = transaction['transaction_bytes'] + transaction['block_hash']
-        key = self.get_key(transaction['txid'], prefix=TRANSACTION_PREFIX)
-        self.session.put(self.storage_name + b'.' + key, data)
+        key = self._storage_key(self.get_key(transaction['txid'], prefix=TRANSACTION_PREFIX))
+        self._transactions_lru.pop(key, None)
+        self.session.put(key, data)
         return transaction
 
     def get_txids_by_block_hash(self, blockhash: str) -> (List[str], int):
@@ -130,7 +140,7 @@ class BlockchainRepository(BlockchainRepositoryAbstract):
             txid = block_index[i:i+32]
             if not txid:
                 break
-            transaction = self.get_transaction(txid)
+            transaction = self.get_transaction(txid, use_lru=False)
             if not transaction:
                 if transactions:
                     Logger.repository.warning('Corrupted storage for blockhash %s, deleting' % blockhash)
@@ -141,17 +151,27 @@ class BlockchainRepository(BlockchainRepositoryAbstract):
             i += 32
         return transactions, int.from_bytes(size, 'little')
 
-    def get_transaction(self, txid: (bytes, str)) -> (None, Dict):
-        key = self.get_key(txid, prefix=TRANSACTION_PREFIX)
-        data = self.session.get(self.storage_name + b'.' + key)
-        if not data:
-            return
+    def get_transaction(self, txid: (bytes, str), use_lru=True) -> (None, Dict):
+        key = self._storage_key(self.get_key(txid, prefix=TRANSACTION_PREFIX))
+        data = self._transactions_lru.get(key)
+        if data is not None:
+            self._transactions_lru.move_to_end(key)
+        else:
+            data = self.session.get(key)
+            if not data:
+                return
+            use_lru and self._add_to_transactions_lru(key, data)
         return {
             'transaction_bytes': data[:-32],
             'block_hash': data[-32:],
             'txid': txid
         }
 
+    def _add_to_transactions_lru(self, key: bytes, data: bytes):
+        self._transactions_lru[key] = data
+        if len(self._transactions_lru) > self._transactions_lru_size:
+            self._transactions_lru.popitem(last=False)
+
     @ldb_batch
     def remove_block(self, blockhash: str):
         txids, size = self.get_txids_by_block_hash(blockhash)
@@ -162,4 +182,6 @@ class BlockchainRepository(BlockchainRepositoryAbstract):
 
     @ldb_batch
     def _remove_item(self, key):
-        self.session.delete(self.storage_name + b'.' + key)
+        key = self._storage_key(key)
+        self._transactions_lru.pop(key, None)
+        self.session.delete(key)
@@ -0,0 +1,51 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+from spruned.repositories.blockchain_repository import BlockchainRepository, TRANSACTION_PREFIX
+
+
+class TestBlockchainRepository(TestCase):
+    def setUp(self):
+        self.session = Mock()
+        self.sut = BlockchainRepository(self.session, b'blocks', '/tmp/dbpath', transactions_lru_size=2)
+        self.txid = 'aa' * 32
+        self.blockhash = b'\x01' * 32
+
+    def tearDown(self):
+        self.session.reset_mock()
+
+    def test_get_transaction_lru(self):
+        self.session.get.return_value = b'txbytes' + self.blockhash
+        tx = self.sut.get_transaction(self.txid)
+        self.assertEqual(tx['transaction_bytes'], b'txbytes')
+        self.assertEqual(tx['block_hash'], self.blockhash)
+        self.assertEqual(self.sut.get_transaction(self.txid), tx)
+        Mock.assert_called_once_with(
+            self.session.get, b'blocks.' + TRANSACTION_PREFIX + b'.' + bytes.fromhex(self.txid)
+        )
+
+        self.sut.save_transaction(
+            {'txid': self.txid, 'transaction_bytes': b'newbytes', 'block_hash': self.blockhash}
+        )
+        self.session.get.return_value = b'newbytes' + self.blockhash
+        self.assertEqual(self.sut.get_transaction(self.txid)['transaction_bytes'], b'newbytes')
+        self.assertEqual(self.session.get.call_count, 2)
+
+        self.sut._remove_item(self.sut.get_key(self.txid, prefix=TRANSACTION_PREFIX))
+        self.session.get.return_value = None
+        self.assertIsNone(self.sut.get_transaction(self.txid))
+
+    def test_get_transaction_lru_is_bounded(self):
+        self.session.get.return_value = b'txbytes' + self.blockhash
+        for txid in ('aa' * 32, 'bb' * 32, 'cc' * 32):
+            self.sut.get_transaction(txid)
+        self.assertEqual(len(self.sut._transactions_lru), 2)
+        self.sut.get_transaction('aa' * 32)
+        self.assertEqual(self.session.get.call_count, 4)
+
+    def test_get_transaction_without_lru(self):
+        self.session.get.return_value = b'txbytes' + self.blockhash
+        self.sut.get_transaction(self.txid, use_lru=False)
+        self.sut.get_transaction(self.txid, use_lru=False)
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertEqual(len(self.sut._transactions_lru), 0)
@@ -1,6 +1,6 @@
 import asyncio
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 import binascii
 
 import time
@@ -62,6 +62,7 @@ class TestElectrodConnection(unittest.TestCase):
             'server info',
             disconnect_callback=self.sut.on_connectrum_disconnect,
             disable_cert_verify=True,
+            ssl_context=None,
             proxy=self.sut.proxy,
             ignore_version=False,
             short_term=False
@@ -124,6 +125,15 @@ class TestElectrodConnection(unittest.TestCase):
         Mock.assert_called_once_with(self.electrod_loop.create_task, 'delayed')
         Mock.assert_called_once_with(self.delayer, coro_call('on_error'))
 
+    def test_rpc_call_cancelled(self):
+        self.client.RPC.return_value = asyncio.sleep(4)
+        task = self.loop.create_task(self.sut.rpc_call('method', ('cafe', 'babe')))
+        self.loop.call_later(0.1, task.cancel)
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(task)
+        Mock.assert_not_called(self.delayer)
+        self.assertEqual(self.sut.score, 10)
+
     def test_ping_success(self):
         self.client.RPC.return_value = asyncio.gather(asyncio.sleep(1.1), async_coro('ElectrumX 1.2'))
         res = self.loop.run_until_complete(self.sut.ping())
@@ -153,6 +163,19 @@ class TestElectrodConnection(unittest.TestCase):
         self.assertTrue(sub_called)
         self.sut._last_header = {'height': '2'}
 
+    def test_poll_queue(self):
+        queue = Mock()
+        queue.get.side_effect = [async_coro([{'height': '2'}]), async_coro([{'height': '3'}]), ConnectionError]
+        callback = Mock(return_value='callback')
+        self.delayer.return_value = 'delayed'
+        self.loop.run_until_complete(self.sut._poll_queue(queue, callback))
+        self.assertEqual(self.sut.last_header, {'height': '3'})
+        self.assertEqual(callback.call_count, 2)
+        Mock.assert_has_calls(
+            self.electrod_loop.create_task, calls=[call('callback'), call('callback'), call('delayed')]
+        )
+        Mock.assert_called_once_with(self.delayer, coro_call('on_error'))
+
     def test_subscribe_error(self):
         self.sut.loop = self.electrod_loop
         self.delayer.return_value = 'delayer'
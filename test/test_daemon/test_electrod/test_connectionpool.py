@@ -1,6 +1,6 @@
 import asyncio
 import unittest
-from unittest.mock import Mock, call, ANY
+from unittest.mock import Mock, call, ANY, patch
 
 import time
 
@@ -91,6 +91,8 @@ class TestElectrodConnectionPool(unittest.TestCase):
         self.assertEqual(on_connected_observer.call_count, 1)
         self.assertEqual(3, len(self.sut.connections))
         self.assertEqual(3, len(self.sut.established_connections))
+        for factory_call in self.connection_factory.call_args_list:
+            self.assertIs(factory_call[1]['ssl_context'], self.sut._ssl_context)
 
     def test_connect_too_much_peers(self):
         """
@@ -136,6 +138,36 @@ class TestElectrodConnectionPool(unittest.TestCase):
         self.assertEqual(c, 2)
         self.assertEqual(1, len([c for c in [conn1, conn2] if c.connected]))
 
+    def test_connect_reconnects_on_disconnection(self):
+        self.sut.loop = self.loop
+        self.network_checker.return_value = async_coro(True)
+        self.sut._required_connections = 1
+        conn1 = Mock(score=10, connected=True, protocol=True, hostname='hostname0')
+        self.sut._connections = [conn1]
+        conn2 = Mock(score=10, connected=False)
+        conn2.connect = lambda: connect(conn2)
+        self.connection_factory.side_effect = [conn2]
+
+        async def _drop_peer():
+            await asyncio.sleep(0.5)
+            conn1.connected = False
+            await self.sut._on_peer_dropped(conn1)
+            await asyncio.sleep(0.5)
+            self.sut.stop()
+
+        s = time.time()
+        self.loop.run_until_complete(
+            asyncio.gather(
+                _drop_peer(),
+                self.sut.connect()
+            )
+        )
+        self.sut.loop = self.electrod_loop
+        self.assertLess(time.time() - s, 5)
+        self.assertEqual(1, self.connection_factory.call_count)
+        self.assertEqual([conn2], self.sut.established_connections)
+        Mock.assert_called_once_with(conn1.add_error, ANY)
+
     def test_call_corners(self):
         with self.assertRaises(ValueError):
             self.loop.run_until_complete(self.sut.call('cafe', {'par': 'ams'}, get_peer=True, agreement=2))
@@ -170,6 +202,41 @@ class TestElectrodConnectionPool(unittest.TestCase):
         res = self.loop.run_until_complete(self.sut.call('cafe', 'babe', agreement=2))
         self.assertEqual(res, response)
 
+    def test_call_success_multiple_agreement_ignore_slow_peer(self):
+        response = 'some response'
+        cancelled = False
+
+        async def slow():
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        conn = Mock(connected=True, protocol=True, score=10)
+        conn.rpc_call.return_value = async_coro(response)
+        conn2 = Mock(connected=True, protocol=True, score=10)
+        conn2.rpc_call.return_value = async_coro(response)
+        conn3 = Mock(connected=True, protocol=True, score=10)
+        conn3.rpc_call.return_value = slow()
+        self.sut._connections = [conn, conn2, conn3]
+        s = time.time()
+        res = self.loop.run_until_complete(self.sut.call('cafe', 'babe', agreement=2))
+        self.loop.run_until_complete(asyncio.sleep(0))
+        self.assertLess(time.time() - s, 1)
+        self.assertEqual(res, response)
+        self.assertTrue(cancelled)
+
+    def test_call_failure_disagreement_on_response_types(self):
+        conn = Mock(connected=True, protocol=True, score=10)
+        conn.rpc_call.return_value = async_coro({'confirmed': 1, 'unconfirmed': 0})
+        conn2 = Mock(connected=True, protocol=True, score=10)
+        conn2.rpc_call.return_value = async_coro({'unconfirmed': False, 'confirmed': True})
+        self.sut._connections = [conn, conn2]
+        with self.assertRaises(exceptions.NoQuorumOnResponsesException):
+            self.loop.run_until_complete(self.sut.call('cafe', 'babe', agreement=2))
+
     def test_call_failure_not_enough_responses(self):
         response = 'some response'
         conn = Mock(connected=True, protocol=True, score=10)
@@ -188,6 +255,20 @@ class TestElectrodConnectionPool(unittest.TestCase):
             )
         )
 
+    def test_call_failure_peer_exception(self):
+        async def broken():
+            raise asyncio.InvalidStateError
+
+        conn = Mock(connected=True, protocol=True, score=10)
+        conn.rpc_call.return_value = async_coro('some response')
+        conn2 = Mock(connected=True, protocol=True, score=10, hostname='hostname2')
+        conn2.rpc_call.return_value = broken()
+        self.sut._connections = [conn, conn2]
+        with patch('spruned.daemon.electrod.electrod_connection.Logger') as logger:
+            with self.assertRaises(exceptions.ElectrodMissingResponseException):
+                self.loop.run_until_complete(self.sut.call('cafe', 'babe', agreement=2))
+        self.assertIn(call('call, peer %s failed: %r', 'hostname2', ANY), logger.electrum.debug.call_args_list)
+
     def test_call_failure_disagreement_on_responses(self):
         response = 'some response'
         response2 = 'another response'
@@ -223,8 +304,7 @@ class TestElectrodConnectionPool(unittest.TestCase):
         self.sut._peers = []
         with self.assertRaises(exceptions.NoServersException):
             self.sut._pick_peer()
-        with self.assertRaises(exceptions.NoServersException):
-            self.sut._pick_multiple_peers(2)
+        self.assertEqual([], self.sut._pick_multiple_peers(2))
         self.sut._peers = s
         with self.assertRaises(exceptions.NoPeersException):
             self.sut._pick_connection()
@@ -233,12 +313,32 @@ class TestElectrodConnectionPool(unittest.TestCase):
         self.assertIsNone(
             self.sut._pick_connection(fail_silent=True)
         )
-        self.sut._peers = ['cafebabe']
+        self.sut._peers = [['cafebabe', 's']]
         self.sut._connections.append(Mock(hostname='cafebabe', connected=True, score=1))
         with self.assertRaises(exceptions.NoServersException):
             self.sut._pick_peer()
-        with self.assertRaises(exceptions.NoServersException):
-            self.sut._pick_multiple_peers(1)
+        self.assertEqual([], self.sut._pick_multiple_peers(1))
+
+    def test_pick_multiple_peers(self):
+        self.sut._peers = [['hostname0', 's'], ['hostname1', 's'], ['::1', 's'], ['hostname2', 's']]
+        self.sut._connections.append(Mock(hostname='hostname0', connected=True, score=1))
+        peers = self.sut._pick_multiple_peers(2)
+        self.assertEqual(2, len(peers))
+        for peer in peers:
+            self.assertIn(peer, [['hostname1', 's'], ['hostname2', 's']])
+
+        peers = self.sut._pick_multiple_peers(5)
+        self.assertEqual(2, len(peers))
+        self.assertEqual(sorted(peers), [['hostname1', 's'], ['hostname2', 's']])
+
+        self.sut._ipv6 = True
+        self.assertEqual(3, len(self.sut._pick_multiple_peers(5)))
+
+    def test_connect_servers_exhausted_pool(self):
+        self.sut._peers = [['hostname0', 's']]
+        self.sut._connections.append(Mock(hostname='hostname0', connected=True, score=1))
+        self.loop.run_until_complete(self.sut._connect_servers(2))
+        Mock.assert_not_called(self.connection_factory)
 
     def test__handle_peer_error_disconnected(self):
         conn = Mock(connected=False)
@@ -292,13 +392,12 @@ class TestElectrodConnectionPool(unittest.TestCase):
         peer = Mock(last_header='header')
         hob = Mock()
         hob.return_value = 'observing'
-        self.delayer.return_value = 'delayerr'
         self.network_checker.return_value = async_coro(True)
         self.sut.add_header_observer(hob)
         self.loop.run_until_complete(self.sut.on_peer_received_header(peer))
-        Mock.assert_called_once_with(self.electrod_loop.create_task, 'delayerr')
+        Mock.assert_called_once_with(self.electrod_loop.create_task, 'observing')
         Mock.assert_called_once_with(hob, peer, 'header')
-        Mock.assert_called_once_with(self.delayer, 'observing')
+        Mock.assert_not_called(self.delayer)
 
     def test_on_peer_error(self):
         peer = Mock(is_online=True, connected=False, _errors=[])
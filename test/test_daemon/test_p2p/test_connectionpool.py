@@ -41,3 +41,11 @@ class TestP2PConnectionPool(TestCase):
                 call(coro_call('_connect_peer')), call(coro_call('_connect_peer'))
             ]
         )
+
+    def test_connect_exhausted_peers(self):
+        self.online_checker.return_value = async_coro(True)
+        self.sut._peers = [['1.2.3.4', 8333]]
+        self.sut._connections.append(Mock(hostname='1.2.3.4', connected=True, score=10))
+        with self.assertRaises(asyncio.TimeoutError):
+            self.loop.run_until_complete(asyncio.wait_for(self.sut.connect(), 1))
+        Mock.assert_not_called(self.loopmock.create_task)